@@ -0,0 +1,108 @@
+"""
+Compiled Kernels Module
+Author: Ashrumochan Sahoo
+Purpose: Optional Numba fast path for the element-wise
+         derived columns in transform (one fused loop)
+"""
+
+import numpy as np
+
+# numba is optional - without it transform
+# keeps using its numpy implementation
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # ============================================
+    # HELPER: _civil_from_days / _days_from_civil
+    # Purpose: Calendar date <-> days since
+    # 1970-01-01 in pure integer arithmetic
+    # (proleptic Gregorian, H. Hinnant's algorithm)
+    # ============================================
+
+    @njit(cache=True)
+    def _civil_from_days(days):
+        z = days + 719468
+        era = (z if z >= 0 else z - 146096) // 146097
+        doe = z - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        month = mp + 3 if mp < 10 else mp - 9
+        year = yoe + era * 400 + (1 if month <= 2 else 0)
+        return year, month
+
+    @njit(cache=True)
+    def _jan_first(year):
+        y = year - 1
+        era = (y if y >= 0 else y - 399) // 400
+        yoe = y - era * 400
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + 306
+        return era * 146097 + doe - 719468
+
+    # ============================================
+    # FUNCTION: derive_columns
+    # Purpose: All element-wise derived columns
+    # in one parallel pass over the inputs
+    # ============================================
+
+    @njit(parallel=True, cache=True)
+    def derive_columns(sales, profit, order_days, ship_days):
+        """
+        Computes the derived columns for rows
+        with valid dates (no NaT handling).
+
+        Args:
+            sales, profit: float64 arrays
+            order_days, ship_days: int64 days
+                since 1970-01-01
+
+        Returns:
+            (margin, delivery_days, year, month,
+             quarter, dow, week, is_weekend) -
+            margin is unrounded, NaN where sales is 0
+        """
+        n = len(sales)
+        margin        = np.empty(n, dtype=np.float64)
+        delivery_days = np.empty(n, dtype=np.int32)
+        year          = np.empty(n, dtype=np.int32)
+        month         = np.empty(n, dtype=np.int32)
+        quarter       = np.empty(n, dtype=np.int32)
+        dow           = np.empty(n, dtype=np.int64)
+        week          = np.empty(n, dtype=np.int32)
+        is_weekend    = np.empty(n, dtype=np.int8)
+
+        for i in prange(n):
+            if sales[i] != 0:
+                margin[i] = profit[i] / sales[i] * 100
+            else:
+                margin[i] = np.nan
+
+            days = order_days[i]
+            delivery_days[i] = ship_days[i] - days
+
+            y, m = _civil_from_days(days)
+            year[i]    = y
+            month[i]   = m
+            quarter[i] = (m - 1) // 3 + 1
+
+            # 1970-01-01 was a Thursday; Monday = 0
+            d = (days - 4) % 7
+            dow[i]        = d
+            is_weekend[i] = 1 if d >= 5 else 0
+
+            # ISO week = week of the year that
+            # this week's Thursday falls in
+            thursday = days - d + 3
+            thursday_year, _ = _civil_from_days(thursday)
+            week[i] = (thursday - _jan_first(thursday_year)) // 7 + 1
+
+        return (
+            margin, delivery_days, year, month,
+            quarter, dow, week, is_weekend
+        )
@@ -5,14 +5,28 @@ Purpose: Centralized settings and configuration for ETL pipeline
 """
 
 import os
+import atexit
 import logging
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from dotenv import load_dotenv
 
 # ============================================
 # Load Environment Variables from .env file
+# Parsed once per process; every setting
+# below is read from this cached snapshot
 # ============================================
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def _env() -> dict:
+    """
+    Loads .env into the environment once
+    and returns a snapshot of it.
+    """
+    load_dotenv()
+    return dict(os.environ)
 
 
 # ============================================
@@ -26,7 +40,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # ============================================
 # DATABASE CONFIGURATION
 # ============================================
-DB_PATH = BASE_DIR / os.getenv("DB_PATH", "data/sales_analytics.db")
+DB_PATH = BASE_DIR / _env().get("DB_PATH", "data/sales_analytics.db")
 
 # SQLAlchemy connection string for SQLite
 # Format: sqlite:///absolute/path/to/database.db
@@ -43,13 +57,33 @@ LOGS_DIR           = BASE_DIR / "logs"
 # ============================================
 # LOGGING CONFIGURATION
 # ============================================
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FILE  = BASE_DIR / os.getenv("LOG_FILE", "logs/pipeline.log")
+LOG_LEVEL = _env().get("LOG_LEVEL", "INFO")
+LOG_FILE  = BASE_DIR / _env().get("LOG_FILE", "logs/pipeline.log")
+
+# Rotate the log file so long-running
+# deployments don't grow it without bound
+LOG_MAX_BYTES    = int(_env().get("LOG_MAX_BYTES", 10 * 1024 * 1024))
+LOG_BACKUP_COUNT = int(_env().get("LOG_BACKUP_COUNT", 5))
 
 # ============================================
 # ETL CONFIGURATION
 # ============================================
-CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", 1000))
+CHUNK_SIZE = int(_env().get("CHUNK_SIZE", 1000))
+
+# Stream the CSV through the pipeline in CHUNK_SIZE
+# pieces instead of loading it all into memory
+STREAMING = _env().get("STREAMING", "0") == "1"
+
+# Write a parquet copy of the raw data during extract
+# Set KEEP_BACKUP=0 to skip it (the raw CSV is already on disk)
+KEEP_BACKUP = _env().get("KEEP_BACKUP", "1") == "1"
+
+# Transformed data is saved as parquet; set
+# TRANSFORMED_CSV=1 to also write the old CSV
+TRANSFORMED_CSV = _env().get("TRANSFORMED_CSV", "0") == "1"
+
+# Gzip that CSV (transformed_sales.csv.gz)
+TRANSFORMED_CSV_GZIP = _env().get("TRANSFORMED_CSV_GZIP", "0") == "1"
 
 # ============================================
 # SETUP LOGGING
@@ -61,26 +95,49 @@ def setup_logging():
     """
     Configures logging for the pipeline.
     Logs go to both console and log file.
+    Log calls only enqueue the record; a
+    background listener thread does the I/O.
+    Safe to call more than once - handlers
+    are only attached the first time.
     """
 
+    # Already configured (repeat call or test
+    # harness) - don't open a second log file
+    if logging.getLogger().handlers:
+        return logging.getLogger(__name__)
+
     # Create logs directory if it doesn't exist
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Configure logging format
     log_format = "%(asctime)s | %(levelname)s | %(module)s | %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
+    formatter = logging.Formatter(log_format, datefmt=date_format)
 
-    logging.basicConfig(
-        level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            # Handler 1: Write to log file
-            logging.FileHandler(LOG_FILE),
-            # Handler 2: Print to terminal
-            logging.StreamHandler()
-        ]
+    # Handler 1: Write to (rotating) log file
+    file_handler = RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT
     )
+    # Handler 2: Print to terminal
+    stream_handler = logging.StreamHandler()
+
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    # Root logger only gets a QueueHandler; the
+    # listener drains the queue into both handlers
+    log_queue = queue.Queue(-1)
+    listener  = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+
+    # Flush whatever is still queued on exit
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, LOG_LEVEL.upper(), logging.INFO))
+    root.addHandler(QueueHandler(log_queue))
 
     return logging.getLogger(__name__)
 
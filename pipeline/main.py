@@ -7,12 +7,19 @@ Purpose: Main entry point for the automated
 """
 
 import logging
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pipeline.config import setup_logging, validate_config
-from pipeline.extract import extract_data, get_extract_summary
-from pipeline.transform import transform_data, get_transform_summary
-from pipeline.load import load_data
+from pipeline.config import setup_logging, validate_config, STREAMING
+from pipeline.extract import extract_data, extract_chunks, get_extract_summary
+from pipeline.transform import (
+    transform_data,
+    transform_chunk,
+    get_transform_summary
+)
+from pipeline.load import load_data, load_data_chunks
 
 
 # ============================================
@@ -116,8 +123,8 @@ def run_pipeline():
         logger.info("  TRANSFORM METRICS:")
         logger.info(f"    Rows after clean  : {transform_summary['total_rows']:,}")
         logger.info(f"    Columns           : {transform_summary['total_columns']}")
-        logger.info(f"    Avg delivery days : {transform_summary['avg_delivery_days']}")
-        logger.info(f"    Avg profit margin : {transform_summary['avg_profit_margin']}%")
+        logger.info(f"    Avg delivery days : {transform_summary['avg_delivery_days']:.1f}")
+        logger.info(f"    Avg profit margin : {transform_summary['avg_profit_margin']:.2f}%")
         logger.info("")
         logger.info("  LOAD METRICS:")
         for table, count in load_counts.items():
@@ -172,6 +179,148 @@ def run_pipeline():
         logger.info(f"  Pipeline finished in {total_time}s")
 
 
+# ============================================
+# HELPER: run_stage
+# Purpose: Run one streaming stage on a worker
+# thread, handing results on through a
+# bounded queue
+# ============================================
+
+# Marks the end of a stage's output
+_STAGE_DONE = object()
+
+# Chunks buffered between two stages
+STAGE_QUEUE_SIZE = 4
+
+
+def run_stage(executor, items, stop: threading.Event):
+    """
+    Iterates items on an executor thread and
+    returns a generator over the results, so the
+    next stage works on chunk K while this one
+    produces chunk K+1.
+
+    An exception in the stage is re-raised in
+    the consumer. Setting stop makes the stage
+    give up instead of blocking on a full queue.
+    """
+    results = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                results.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((_STAGE_DONE, None))
+        except BaseException as e:
+            put((_STAGE_DONE, e))
+
+    executor.submit(produce)
+
+    def consume():
+        while not stop.is_set():
+            try:
+                item, error = results.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if error is not None:
+                raise error
+            if item is _STAGE_DONE:
+                return
+            yield item
+
+    return consume()
+
+
+# ============================================
+# STREAMING PIPELINE FUNCTION
+# Purpose: Same ETL, one CHUNK_SIZE piece at a
+# time - memory stays flat for large files
+# ============================================
+
+def run_pipeline_streaming():
+    """
+    Runs the ETL pipeline chunk by chunk as
+    three overlapping stages: extract and
+    transform each run on their own thread
+    while the main thread loads.
+
+    Returns:
+        dict: Pipeline execution summary
+    """
+
+    logger = setup_logging()
+
+    pipeline_start = time.time()
+    start_datetime = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    logger.info("=" * 60)
+    logger.info("  AUTOMATED SALES REPORTING PIPELINE (STREAMING)")
+    logger.info("=" * 60)
+    logger.info(f"  Started at : {start_datetime}")
+    logger.info("=" * 60)
+
+    stop = threading.Event()
+
+    try:
+        validate_config()
+
+        # Row hashes shared by every chunk so
+        # duplicates across chunks are dropped
+        # (only the transform thread touches it)
+        seen_rows = set()
+
+        # Disk reads, pandas work and SQLite inserts
+        # mostly release the GIL, so the stages overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            try:
+                raw_chunks = run_stage(executor, extract_chunks(), stop)
+                chunks = run_stage(
+                    executor,
+                    (transform_chunk(chunk, seen_rows) for chunk in raw_chunks),
+                    stop
+                )
+                load_counts = load_data_chunks(chunks)
+            finally:
+                # Let the workers exit if load stopped early
+                stop.set()
+
+        total_time = round(time.time() - pipeline_start, 2)
+
+        logger.info("")
+        logger.info("=" * 60)
+        logger.info("  PIPELINE EXECUTION SUMMARY")
+        logger.info("=" * 60)
+        logger.info(f"  Status          : ✅ SUCCESS")
+        logger.info(f"  Total time      : {total_time}s")
+        for table, count in load_counts.items():
+            logger.info(f"    {table:<25}: {count:,} rows")
+        logger.info("=" * 60)
+
+        return {
+            "status"      : "SUCCESS",
+            "total_time"  : total_time,
+            "load_counts" : load_counts
+        }
+
+    except Exception as e:
+        logger.error("")
+        logger.error("=" * 60)
+        logger.error(f"  ❌ PIPELINE FAILED")
+        logger.error(f"  Error: {e}")
+        logger.error("=" * 60)
+        raise
+
+
 # ============================================
 # ENTRY POINT
 # Purpose: Allows running as script
@@ -181,7 +330,7 @@ def run_pipeline():
 # ============================================
 
 if __name__ == "__main__":
-    result = run_pipeline()
+    result = run_pipeline_streaming() if STREAMING else run_pipeline()
     print("\n✅ Pipeline completed successfully!")
     print(f"   Total time : {result['total_time']}s")
     print(f"   Rows loaded: {result['load_counts']['fact_sales']:,}")
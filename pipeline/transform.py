@@ -6,13 +6,64 @@ Purpose: Clean, standardize and transform raw sales data
 """
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from pipeline.config import PROCESSED_DATA_PATH
+from pipeline import _kernels
+from pipeline.config import (
+    PROCESSED_DATA_PATH,
+    TRANSFORMED_CSV,
+    TRANSFORMED_CSV_GZIP
+)
+from pipeline.utils import total_nulls
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Characters in raw headers that become underscores
+_COLUMN_SEPARATORS = re.compile(r'[ \-/]')
+
+# Lookup tables for month / day names
+# (index = month - 1 / dayofweek)
+_MONTH_NAMES = [
+    'January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December'
+]
+_DAY_NAMES = [
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday',
+    'Friday', 'Saturday', 'Sunday'
+]
+
+# Target dtypes for the numeric columns
+NUMERIC_DTYPES = {
+    'sales'    : 'float64',
+    'profit'   : 'float64',
+    'discount' : 'float64',
+    'quantity' : 'Int32'
+}
+
+# ID columns that arrive as plain Python strings
+# are switched to Arrow-backed strings
+ID_COLUMNS = ['order_id', 'customer_id', 'product_id']
+
+# Low-cardinality text columns kept as category
+# (1-byte codes instead of one string per row)
+CATEGORICAL_COLS = [
+    'segment', 'ship_mode', 'region', 'category',
+    'sub_category', 'country', 'city', 'state'
+]
+
+# Above this many rows add_derived_columns uses
+# the compiled kernel (when numba is installed)
+NUMBA_MIN_ROWS = 100_000
+
+# Below this many rows, converting text columns
+# one after another beats starting a thread pool
+PARALLEL_MIN_ROWS = 50_000
+
 
 # ============================================
 # FUNCTION 1: clean_column_names
@@ -29,13 +80,12 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Cleaning column names...")
 
-    df.columns = (
-        df.columns
-        .str.lower()
-        .str.replace(' ', '_')
-        .str.replace('-', '_')
-        .str.replace('/', '_')
-    )
+    # One regex pass per name instead of a chain
+    # of .str.replace calls over the whole Index
+    df.columns = [
+        _COLUMN_SEPARATORS.sub('_', col.strip().lower())
+        for col in df.columns
+    ]
 
     logger.info(f"✅ Columns standardized: {list(df.columns)}")
     return df
@@ -47,15 +97,34 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
 # We found 1 duplicate in extract phase
 # ============================================
 
-def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+def remove_duplicates(df: pd.DataFrame, seen_rows: set = None) -> pd.DataFrame:
     """
     Removes duplicate rows from DataFrame.
     Logs how many duplicates were removed.
+
+    When streaming, pass the same seen_rows set
+    for every chunk: rows whose hash is already in
+    it (seen in an earlier chunk) are dropped too.
     """
     logger.info("Checking for duplicates...")
 
     before = len(df)
-    df = df.drop_duplicates().copy()
+    if seen_rows is None:
+        duplicate = df.duplicated().to_numpy()
+    else:
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+        duplicate = row_hashes.duplicated().to_numpy() | np.fromiter(
+            (row_hash in seen_rows for row_hash in row_hashes),
+            dtype=bool,
+            count=len(row_hashes)
+        )
+        seen_rows.update(row_hashes[~duplicate])
+
+    # One positional take builds the deduplicated
+    # frame (no second .copy(), and take doesn't
+    # flag it as a slice); no duplicates = no copy
+    if duplicate.any():
+        df = df.take(np.flatnonzero(~duplicate))
     after = len(df)
     removed = before - after
 
@@ -85,24 +154,53 @@ def fix_data_types(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Fixing data types...")
 
-    # Convert date columns
-    df['order_date'] = pd.to_datetime(
-        df['order_date'],
-        format='%Y-%m-%d',
-        errors='coerce'
-    )
+    # extract already parses dates and numerics;
+    # only columns still holding text (e.g. a bad
+    # value made the reader give up) are converted.
+    # cache=True parses each distinct date string once
+    pending = {}
+    for col in ['order_date', 'ship_date']:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            pending[col] = partial(
+                pd.to_datetime,
+                df[col],
+                format='%Y-%m-%d',
+                errors='coerce',
+                cache=True
+            )
+    for col in NUMERIC_DTYPES:
+        if df[col].dtype == object:
+            pending[col] = partial(pd.to_numeric, df[col], errors='coerce')
+
+    # The conversions are independent and release
+    # the GIL in C, so large frames run them in parallel
+    if len(pending) > 1 and len(df) > PARALLEL_MIN_ROWS:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {
+                col: executor.submit(convert)
+                for col, convert in pending.items()
+            }
+        converted = {col: future.result() for col, future in futures.items()}
+    else:
+        converted = {col: convert() for col, convert in pending.items()}
 
-    df['ship_date'] = pd.to_datetime(
-        df['ship_date'],
-        format='%Y-%m-%d',
-        errors='coerce'
-    )
+    for col, values in converted.items():
+        df[col] = values
+
+    # Then cast all numerics in one astype call
+    df = df.astype(NUMERIC_DTYPES, copy=False)
+
+    # Quantity fits the smallest nullable integer
+    # its values allow (usually Int8). Money and
+    # discount stay float64 - float32 would change
+    # the values written to the warehouse
+    df['quantity'] = pd.to_numeric(df['quantity'], downcast='integer')
 
-    # Convert numeric columns
-    df['sales']    = pd.to_numeric(df['sales'],    errors='coerce')
-    df['profit']   = pd.to_numeric(df['profit'],   errors='coerce')
-    df['discount'] = pd.to_numeric(df['discount'], errors='coerce')
-    df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce').astype('Int64')
+    # Categorical IDs already hash as integer codes;
+    # only object-dtype IDs need converting
+    for col in ID_COLUMNS:
+        if df[col].dtype == object:
+            df[col] = df[col].astype('string[pyarrow]')
 
     # Check for any conversion failures (NaT or NaN)
     date_nulls = df['order_date'].isnull().sum()
@@ -120,6 +218,85 @@ def fix_data_types(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+# ============================================
+# FUNCTION: downcast_categoricals
+# Purpose: Store repeated labels as category
+# ============================================
+
+def downcast_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts CATEGORICAL_COLS to category dtype.
+    Columns extract already read as category
+    are left alone.
+    """
+    for col in CATEGORICAL_COLS:
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+    return df
+
+
+# ============================================
+# HELPER: _with_missing
+# Purpose: Put NaN back where the source
+# date was missing (NaT)
+# ============================================
+
+def _with_missing(values: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    """
+    Returns values unchanged when nothing is missing,
+    otherwise as float with NaN at the missing rows
+    (same as the pandas .dt accessors).
+    """
+    if not missing.any():
+        return values
+    return np.where(missing, np.nan, values)
+
+
+# ============================================
+# HELPER: _derive_numpy
+# Purpose: Element-wise derived columns as
+# whole-array numpy operations
+# ============================================
+
+def _derive_numpy(sales, profit, order_days, ship_days) -> tuple:
+    """
+    numpy version of _kernels.derive_columns.
+    Rows with missing dates hold garbage and are
+    masked to NaN by the caller.
+    """
+    # Divide only where sales != 0 (the rest stay
+    # NaN) - no replaced copy of the sales column
+    margin = np.full_like(sales, np.nan)
+    np.divide(profit, sales, out=margin, where=sales != 0)
+    margin *= 100
+
+    # Dates as whole-day integers (days since
+    # 1970-01-01, a Thursday); every date part
+    # is derived arithmetically from them
+    year  = order_days.astype('datetime64[Y]').astype('int32') + 1970
+    month = order_days.astype('datetime64[M]').astype('int32') % 12 + 1
+    dow   = (order_days.astype('int64') - 4) % 7    # Monday = 0
+
+    # ISO week = week of the year that
+    # this week's Thursday falls in
+    thursday = order_days - (dow - 3).astype('timedelta64[D]')
+    week = (
+        (thursday - thursday.astype('datetime64[Y]')).astype('int32') // 7 + 1
+    )
+
+    return (
+        margin,
+        (ship_days - order_days).astype('int32'),
+        year,
+        month,
+        (month - 1) // 3 + 1,
+        dow,
+        week,
+        (dow >= 5).astype('int8')
+    )
+
+
 # ============================================
 # FUNCTION 4: add_derived_columns
 # Purpose: Create new useful columns
@@ -136,25 +313,51 @@ def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Adding derived columns...")
 
-    # Profit margin percentage
-    df['profit_margin'] = round(
-        df['profit'] / df['sales'].replace(0, pd.NA) * 100,
-        2
-    )
+    sales       = df['sales'].to_numpy(dtype='float64')
+    profit      = df['profit'].to_numpy(dtype='float64')
+    order_days  = df['order_date'].to_numpy(dtype='datetime64[D]')
+    ship_days   = df['ship_date'].to_numpy(dtype='datetime64[D]')
+    missing     = np.isnat(order_days)
+    any_missing = missing | np.isnat(ship_days)
+
+    # Large frames with complete dates: one fused
+    # compiled loop; otherwise numpy array passes
+    if (_kernels.NUMBA_AVAILABLE
+            and len(df) > NUMBA_MIN_ROWS
+            and not any_missing.any()):
+        (margin, delivery_days, year, month,
+         quarter, dow, week, is_weekend) = _kernels.derive_columns(
+            sales, profit,
+            order_days.view('int64'), ship_days.view('int64')
+        )
+    else:
+        (margin, delivery_days, year, month,
+         quarter, dow, week, is_weekend) = _derive_numpy(
+            sales, profit, order_days, ship_days
+        )
+
+    # Profit margin percentage (NaN where sales is 0)
+    df['profit_margin'] = np.round(margin, 2)
 
     # Delivery days (how long to ship)
-    df['delivery_days'] = (
-        df['ship_date'] - df['order_date']
-    ).dt.days
+    df['delivery_days']    = _with_missing(delivery_days, any_missing)
 
     # Date components for time analysis
-    df['order_year']       = df['order_date'].dt.year
-    df['order_month']      = df['order_date'].dt.month
-    df['order_quarter']    = df['order_date'].dt.quarter
-    df['order_month_name'] = df['order_date'].dt.strftime('%B')
-    df['order_day_name']   = df['order_date'].dt.strftime('%A')
-    df['order_week']       = df['order_date'].dt.isocalendar().week.astype(int)
-    df['is_weekend']       = df['order_date'].dt.dayofweek.isin([5, 6]).astype(int)
+    df['order_year']       = _with_missing(year, missing)
+    df['order_month']      = _with_missing(month, missing)
+    df['order_quarter']    = _with_missing(quarter, missing)
+    # Names via an integer gather into a categorical
+    # instead of strftime per row (NaT -> code -1 -> NaN)
+    df['order_month_name'] = pd.Categorical.from_codes(
+        np.where(missing, -1, month - 1),
+        categories=_MONTH_NAMES
+    )
+    df['order_day_name']   = pd.Categorical.from_codes(
+        np.where(missing, -1, dow),
+        categories=_DAY_NAMES
+    )
+    df['order_week']       = _with_missing(week, missing)
+    df['is_weekend']       = _with_missing(is_weekend, missing)
 
     logger.info(f"✅ Derived columns added:")
     logger.info(f"   profit_margin  : profit as % of sales")
@@ -183,28 +386,39 @@ def handle_nulls(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Handling null values...")
 
-    null_before = df.isnull().sum().sum()
+    # One null scan; only columns that actually
+    # have nulls are touched afterwards
+    null_counts = df.isnull().sum()
+    null_before = null_counts.sum()
 
     if null_before == 0:
         logger.info(f"✅ No null values to handle")
         return df
 
+    null_counts = null_counts[null_counts > 0]
+    numeric_cols = [
+        col for col in null_counts.index
+        if pd.api.types.is_numeric_dtype(df[col])
+    ]
+    text_cols = null_counts.index.difference(numeric_cols, sort=False)
+
     # Fill nulls based on column type
-    for col in df.columns:
-        null_count = df[col].isnull().sum()
-        if null_count > 0:
-            if df[col].dtype in ['float64', 'int64', 'Int64']:
-                df[col] = df[col].fillna(0)
-                logger.warning(
-                    f"⚠️  Filled {null_count} nulls in '{col}' with 0"
-                )
-            else:
-                df[col] = df[col].fillna('Unknown')
-                logger.warning(
-                    f"⚠️  Filled {null_count} nulls in '{col}' with 'Unknown'"
-                )
-
-    null_after = df.isnull().sum().sum()
+    for col in numeric_cols:
+        df[col] = df[col].fillna(0)
+    for col in text_cols:
+        # Categorical columns only accept known labels
+        if (isinstance(df[col].dtype, pd.CategoricalDtype)
+                and 'Unknown' not in df[col].cat.categories):
+            df[col] = df[col].cat.add_categories('Unknown')
+        df[col] = df[col].fillna('Unknown')
+
+    for col, null_count in null_counts.items():
+        fill_value = 0 if col in numeric_cols else "'Unknown'"
+        logger.warning(
+            f"⚠️  Filled {null_count} nulls in '{col}' with {fill_value}"
+        )
+
+    null_after = total_nulls(df[null_counts.index])
     logger.info(f"✅ Null handling complete")
     logger.info(f"   Nulls before : {null_before}")
     logger.info(f"   Nulls after  : {null_after}")
@@ -228,36 +442,44 @@ def validate_data(df: pd.DataFrame) -> bool:
     errors = []
 
     # Check 1: No null values in critical columns
+    # (one isnull pass over just these columns)
     critical_cols = [
         'order_id', 'order_date', 'customer_id',
         'product_id', 'sales', 'quantity', 'profit'
     ]
-    for col in critical_cols:
-        null_count = df[col].isnull().sum()
-        if null_count > 0:
-            errors.append(
-                f"Critical column '{col}' has {null_count} null values"
-            )
+    null_counts = df[critical_cols].isnull().sum()
+    for col, null_count in null_counts[null_counts > 0].items():
+        errors.append(
+            f"Critical column '{col}' has {null_count} null values"
+        )
+
+    # Fetch each checked column as a plain numpy
+    # array once (missing values -> NaN, which
+    # fails every comparison below)
+    quantity      = df['quantity'].to_numpy(dtype='float64', na_value=np.nan)
+    sales         = df['sales'].to_numpy(dtype='float64', na_value=np.nan)
+    discount      = df['discount'].to_numpy(dtype='float64', na_value=np.nan)
+    delivery_days = df['delivery_days'].to_numpy(dtype='float64', na_value=np.nan)
 
     # Check 2: No negative quantities
-    neg_qty = (df['quantity'] < 0).sum()
+    neg_qty = np.count_nonzero(quantity < 0)
     if neg_qty > 0:
         errors.append(f"{neg_qty} rows have negative quantity")
 
     # Check 3: No negative sales
-    neg_sales = (df['sales'] < 0).sum()
+    neg_sales = np.count_nonzero(sales < 0)
     if neg_sales > 0:
         errors.append(f"{neg_sales} rows have negative sales")
 
     # Check 4: Delivery days should be >= 0
-    neg_delivery = (df['delivery_days'] < 0).sum()
+    neg_delivery = np.count_nonzero(delivery_days < 0)
     if neg_delivery > 0:
         logger.warning(
             f"⚠️  {neg_delivery} rows have negative delivery days"
         )
 
     # Check 5: Discount between 0 and 1
-    bad_discount = ((df['discount'] < 0) | (df['discount'] > 1)).sum()
+    bad_discount = np.count_nonzero((discount < 0) | (discount > 1))
     if bad_discount > 0:
         errors.append(f"{bad_discount} rows have invalid discount values")
 
@@ -307,6 +529,7 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # Step 3: Fix data types
     df = fix_data_types(df)
+    df = downcast_categoricals(df)
 
     # Step 4: Add derived columns
     df = add_derived_columns(df)
@@ -318,10 +541,34 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     validate_data(df)
 
     # Step 7: Save transformed data
-    transformed_path = PROCESSED_DATA_PATH / "transformed_sales.csv"
-    df.to_csv(transformed_path, index=False)
+    # Columnar binary write - no float/date to
+    # text formatting like to_csv
+    transformed_path = PROCESSED_DATA_PATH / "transformed_sales.parquet"
+    df.to_parquet(transformed_path, compression='zstd', index=False)
     logger.info(f"✅ Transformed data saved to: {transformed_path}")
 
+    # CSV copy only for consumers that still need it
+    if TRANSFORMED_CSV:
+        csv_path = transformed_path.with_suffix('.csv')
+        compression = None
+        if TRANSFORMED_CSV_GZIP:
+            # Fastest gzip level - most of the size
+            # win for a fraction of the CPU
+            csv_path = csv_path.with_suffix('.csv.gz')
+            compression = {'method': 'gzip', 'compresslevel': 1}
+
+        # Big write chunks, fixed newline and a
+        # fixed date format (no per-value isoformat)
+        df.to_csv(
+            csv_path,
+            index=False,
+            chunksize=200_000,
+            lineterminator='\n',
+            date_format='%Y-%m-%d',
+            compression=compression
+        )
+        logger.info(f"✅ Transformed CSV saved to: {csv_path}")
+
     logger.info(f"Output rows : {len(df):,}")
     logger.info(f"Output cols : {len(df.columns):,}")
     logger.info("TRANSFORM PHASE COMPLETED")
@@ -330,6 +577,34 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+# ============================================
+# FUNCTION: transform_chunk
+# Purpose: Same steps as transform_data for one
+# chunk of a streamed extract
+# ============================================
+
+def transform_chunk(df: pd.DataFrame, seen_rows: set) -> pd.DataFrame:
+    """
+    Transforms one chunk of raw data.
+
+    Args:
+        df: Raw DataFrame chunk from extract_chunks
+        seen_rows: Row hashes from earlier chunks,
+            shared across the whole stream
+
+    Returns:
+        Cleaned and transformed chunk
+    """
+    df = clean_column_names(df)
+    df = remove_duplicates(df, seen_rows)
+    df = fix_data_types(df)
+    df = downcast_categoricals(df)
+    df = add_derived_columns(df)
+    df = handle_nulls(df)
+    validate_data(df)
+    return df
+
+
 # ============================================
 # FUNCTION 7: get_transform_summary
 # Purpose: Return metrics about transformed data
@@ -339,18 +614,33 @@ def get_transform_summary(df: pd.DataFrame) -> dict:
     """
     Returns summary metrics of transformed data.
     """
+    # Counts, date range and the delivery/margin
+    # averages read from one agg table
+    agg_result = df.agg({
+        'order_id'      : 'nunique',
+        'customer_id'   : 'nunique',
+        'product_id'    : 'nunique',
+        'order_date'    : ['min', 'max'],
+        'delivery_days' : 'mean',
+        'profit_margin' : 'mean',
+        'sales'         : 'sum',
+        'profit'        : 'sum'
+    })
+
     summary = {
         "total_rows"        : len(df),
         "total_columns"     : len(df.columns),
-        "null_values"       : df.isnull().sum().sum(),
-        "unique_orders"     : df['order_id'].nunique(),
-        "unique_customers"  : df['customer_id'].nunique(),
-        "unique_products"   : df['product_id'].nunique(),
-        "date_min"          : str(df['order_date'].min()),
-        "date_max"          : str(df['order_date'].max()),
-        "avg_delivery_days" : round(df['delivery_days'].mean(), 1),
-        "avg_profit_margin" : round(df['profit_margin'].mean(), 2),
-        "total_sales"       : round(df['sales'].sum(), 2),
-        "total_profit"      : round(df['profit'].sum(), 2)
+        "null_values"       : total_nulls(df),
+        "unique_orders"     : int(agg_result.at['nunique', 'order_id']),
+        "unique_customers"  : int(agg_result.at['nunique', 'customer_id']),
+        "unique_products"   : int(agg_result.at['nunique', 'product_id']),
+        "date_min"          : str(agg_result.at['min', 'order_date']),
+        "date_max"          : str(agg_result.at['max', 'order_date']),
+        # Raw values - rounding is left to whoever
+        # displays them (see the run_pipeline log)
+        "avg_delivery_days" : agg_result.at['mean', 'delivery_days'],
+        "avg_profit_margin" : agg_result.at['mean', 'profit_margin'],
+        "total_sales"       : agg_result.at['sum', 'sales'],
+        "total_profit"      : agg_result.at['sum', 'profit']
     }
     return summary
@@ -0,0 +1,22 @@
+"""
+Shared Utilities Module
+Author: Ashrumochan Sahoo
+Purpose: Small helpers used by more than one
+         pipeline phase
+"""
+
+import pandas as pd
+
+
+# ============================================
+# HELPER: total_nulls
+# Purpose: Count every null cell in a frame
+# ============================================
+
+def total_nulls(df: pd.DataFrame) -> int:
+    """
+    Returns the number of null cells in df.
+    Sums the isna() bool array in one pass instead
+    of building a per-column Series first.
+    """
+    return int(df.isna().to_numpy().sum())
@@ -75,7 +75,7 @@ CREATE TABLE dim_date (
 -- ============================================
 
 CREATE TABLE dim_customer (
-    customer_key    INTEGER PRIMARY KEY AUTOINCREMENT,
+    customer_key    INTEGER PRIMARY KEY,
     customer_id     TEXT UNIQUE NOT NULL,
     customer_name   TEXT,
     segment         TEXT,
@@ -95,7 +95,7 @@ CREATE TABLE dim_customer (
 -- ============================================
 
 CREATE TABLE dim_product (
-    product_key     INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_key     INTEGER PRIMARY KEY,
     product_id      TEXT UNIQUE NOT NULL,
     product_name    TEXT,
     category        TEXT,
@@ -109,7 +109,7 @@ CREATE TABLE dim_product (
 -- ============================================
 
 CREATE TABLE dim_shipping (
-    shipping_key    INTEGER PRIMARY KEY AUTOINCREMENT,
+    shipping_key    INTEGER PRIMARY KEY,
     ship_mode       TEXT UNIQUE NOT NULL
 );
 
@@ -122,7 +122,7 @@ CREATE TABLE dim_shipping (
 -- ============================================
 
 CREATE TABLE fact_sales (
-    sales_key           INTEGER PRIMARY KEY AUTOINCREMENT,
+    sales_key           INTEGER PRIMARY KEY,
     order_id            TEXT NOT NULL,
     order_date_key      INTEGER NOT NULL,
     ship_date_key       INTEGER NOT NULL,
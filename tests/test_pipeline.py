@@ -61,6 +61,43 @@ def sample_transformed_df(sample_raw_df):
     return transform_data(sample_raw_df)
 
 
+@pytest.fixture
+def temp_warehouse(tmp_path):
+    """
+    Points the loader at a throwaway SQLite
+    file and returns its path.
+    """
+    from sqlalchemy import create_engine
+    db_path = tmp_path / "warehouse.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    with patch('pipeline.load.get_engine', return_value=engine):
+        yield db_path
+    engine.dispose()
+
+
+def read_tables(db_path):
+    """
+    Returns every warehouse table as a sorted
+    list of rows (staging without its timestamp).
+    """
+    tables = {
+        'staging_raw_sales' : 'SELECT order_id, customer_id, product_id, '
+                              'order_date, sales FROM staging_raw_sales',
+        'dim_date'          : 'SELECT * FROM dim_date',
+        'dim_customer'      : 'SELECT * FROM dim_customer',
+        'dim_product'       : 'SELECT * FROM dim_product',
+        'dim_shipping'      : 'SELECT * FROM dim_shipping',
+        'fact_sales'        : 'SELECT * FROM fact_sales'
+    }
+    conn = sqlite3.connect(db_path)
+    rows = {
+        table: sorted(conn.execute(query).fetchall())
+        for table, query in tables.items()
+    }
+    conn.close()
+    return rows
+
+
 # ============================================
 # TESTS: EXTRACT MODULE
 # ============================================
@@ -88,6 +125,49 @@ class TestExtract:
         summary = get_extract_summary(sample_raw_df)
         assert summary['total_sales'] == 450.0
 
+    def test_extract_summary_counts_unique_and_duplicates(self, sample_raw_df):
+        from pipeline.extract import get_extract_summary
+        summary = get_extract_summary(sample_raw_df)
+        assert summary['unique_orders'] == 3
+        assert summary['unique_customers'] == 3
+        assert summary['duplicate_rows'] == 1
+
+    def test_extract_data_reads_typed_columns(self, sample_raw_df, tmp_path):
+        from pipeline.extract import extract_data, get_extract_summary
+        csv_path = tmp_path / "sales_data.csv"
+        sample_raw_df.to_csv(csv_path, index=False)
+        # No raw_backup.parquet in the working tree
+        with patch('pipeline.extract.KEEP_BACKUP', False):
+            df = extract_data(csv_path)
+        assert str(df['Order Date'].dtype) == 'datetime64[ns]'
+        assert str(df['Region'].dtype) == 'category'
+        assert str(df['Order ID'].dtype) == 'string'
+        assert df.attrs['null_counts']['Sales'] == 0
+        assert get_extract_summary(df)['null_values'] == 0
+
+    def test_malformed_numbers_are_coerced(self, sample_raw_df, tmp_path):
+        from pipeline.extract import extract_data, extract_chunks
+        from pipeline.transform import transform_data, transform_chunk
+        raw = sample_raw_df.astype({'Sales': object, 'Quantity': object, 'Discount': object})
+        raw.loc[0, 'Sales'] = 'abc'
+        raw.loc[1, 'Quantity'] = 'two'
+        raw.loc[2, 'Discount'] = '-'
+        csv_path = tmp_path / "sales_data.csv"
+        raw.to_csv(csv_path, index=False)
+
+        with patch('pipeline.extract.KEEP_BACKUP', False):
+            batch = transform_data(extract_data(csv_path))
+        streamed = pd.concat([
+            transform_chunk(chunk, set())
+            for chunk in extract_chunks(csv_path, chunk_size=2)
+        ], ignore_index=True)
+
+        # Row 0 no longer duplicates row 3 once Sales differs
+        for df in (batch, streamed):
+            assert df['sales'].tolist() == [0.0, 200.0, 50.0, 100.0]
+            assert df['quantity'].tolist() == [1, 0, 3, 1]
+            assert df['discount'].tolist() == [0.0, 0.1, 0.0, 0.0]
+
     def test_extract_file_not_found(self):
         from pipeline.extract import extract_data
         with pytest.raises(FileNotFoundError):
@@ -116,6 +196,14 @@ class TestTransform:
         df = remove_duplicates(df)
         assert len(df) == 3
 
+    def test_remove_duplicates_across_chunks(self, sample_raw_df):
+        from pipeline.transform import clean_column_names, remove_duplicates
+        df = clean_column_names(sample_raw_df.copy())
+        seen_rows = set()
+        first = remove_duplicates(df.iloc[:2], seen_rows)
+        second = remove_duplicates(df.iloc[2:], seen_rows)
+        assert len(first) + len(second) == 3
+
     def test_fix_data_types_dates(self, sample_raw_df):
         from pipeline.transform import (
             clean_column_names,
@@ -173,6 +261,72 @@ class TestTransform:
         first_row_margin = df.iloc[0]['profit_margin']
         assert first_row_margin == 20.0
 
+    def test_derived_dates_match_dt_accessors(self):
+        from pipeline.transform import add_derived_columns
+        # Year boundaries where ISO week/year differ from
+        # the calendar year, plus missing order/ship dates
+        order_date = pd.to_datetime(pd.Series([
+            '2020-12-31', '2021-01-03', '2026-12-28',
+            '2019-12-30', None, '2024-02-29'
+        ]))
+        ship_date = order_date + pd.Timedelta(days=3)
+        ship_date[5] = pd.NaT
+        df = add_derived_columns(pd.DataFrame({
+            'sales'      : [100.0] * 6,
+            'profit'     : [10.0] * 6,
+            'order_date' : order_date,
+            'ship_date'  : ship_date
+        }))
+
+        expected = {
+            'order_year'    : order_date.dt.year,
+            'order_month'   : order_date.dt.month,
+            'order_quarter' : order_date.dt.quarter,
+            'order_week'    : order_date.dt.isocalendar().week,
+            'is_weekend'    : (order_date.dt.dayofweek >= 5).where(order_date.notna()),
+            'delivery_days' : (ship_date - order_date).dt.days
+        }
+        for col, values in expected.items():
+            pd.testing.assert_series_equal(
+                df[col].astype('float64'), values.astype('float64'),
+                check_names=False
+            )
+        for col, values in {
+            'order_month_name' : order_date.dt.month_name(),
+            'order_day_name'   : order_date.dt.day_name()
+        }.items():
+            pd.testing.assert_series_equal(
+                df[col].astype(object), values.astype(object),
+                check_names=False
+            )
+
+    def test_numba_kernel_matches_numpy(self):
+        pytest.importorskip('numba')
+        import numpy as np
+        from pipeline._kernels import derive_columns
+        from pipeline.transform import _derive_numpy
+        # Every day across several year boundaries
+        order_days = np.arange(
+            '2019-12-01', '2027-01-15', dtype='datetime64[D]'
+        )
+        ship_days = order_days + np.arange(len(order_days)) % 9
+        sales  = np.where(np.arange(len(order_days)) % 5 == 0, 0.0, 250.0)
+        profit = np.linspace(-50.0, 50.0, len(order_days))
+
+        expected = _derive_numpy(sales, profit, order_days, ship_days)
+        result = derive_columns(
+            sales, profit,
+            order_days.view('int64'), ship_days.view('int64')
+        )
+        for got, want in zip(result, expected):
+            np.testing.assert_array_equal(got, want)
+
+    def test_profit_margin_zero_sales(self, sample_raw_df):
+        from pipeline.transform import transform_data
+        sample_raw_df.loc[0, 'Sales'] = 0.0
+        df = transform_data(sample_raw_df)
+        assert df.iloc[0]['profit_margin'] == 0.0
+
     def test_validate_data_passes(self, sample_raw_df):
         from pipeline.transform import (
             clean_column_names,
@@ -188,6 +342,23 @@ class TestTransform:
         result = validate_data(df)
         assert result == True
 
+    def test_validate_data_rejects_bad_values(self, sample_raw_df):
+        from pipeline.transform import (
+            clean_column_names,
+            remove_duplicates,
+            fix_data_types,
+            add_derived_columns,
+            validate_data
+        )
+        df = clean_column_names(sample_raw_df.copy())
+        df = remove_duplicates(df)
+        df = fix_data_types(df)
+        df = add_derived_columns(df)
+        df.loc[0, 'sales'] = -1.0
+        df.loc[1, 'discount'] = 1.5
+        with pytest.raises(ValueError, match="negative sales"):
+            validate_data(df)
+
     def test_transform_data_reduces_duplicates(self, sample_raw_df):
         from pipeline.transform import transform_data
         df = transform_data(sample_raw_df)
@@ -203,6 +374,146 @@ class TestTransform:
         df = transform_data(sample_raw_df)
         assert df.isnull().sum().sum() == 0
 
+    def test_handle_nulls_categorical_with_unknown(self, sample_raw_df):
+        from pipeline.transform import handle_nulls
+        df = sample_raw_df.copy()
+        df['City'] = pd.Categorical(['Unknown', None, 'Chicago', 'New York'])
+        df = handle_nulls(df)
+        assert df['City'].tolist() == ['Unknown', 'Unknown', 'Chicago', 'New York']
+
+
+# ============================================
+# TESTS: LOAD MODULE
+# ============================================
+
+class TestLoad:
+    """Tests for pipeline/load.py"""
+
+    def test_bulk_insert_writes_all_rows(self):
+        from pipeline.load import bulk_insert
+        conn = sqlite3.connect(':memory:')
+        conn.execute("CREATE TABLE t (name TEXT, qty INTEGER, amount REAL)")
+        df = pd.DataFrame({
+            'name'   : pd.Categorical(['a', 'b', 'c']),
+            'qty'    : pd.array([1, None, 3], dtype='Int64'),
+            'amount' : [1.5, 2.5, 3.5]
+        })
+        assert bulk_insert(conn, 't', df) == 3
+        rows = conn.execute("SELECT * FROM t ORDER BY name").fetchall()
+        assert rows == [('a', 1, 1.5), ('b', None, 2.5), ('c', 3, 3.5)]
+        conn.close()
+
+    def test_load_data_fact_keys_join_back_to_dims(self, sample_transformed_df):
+        from sqlalchemy import create_engine
+        from sqlalchemy.pool import StaticPool
+        from pipeline.load import load_data
+        # One shared in-memory database for every checkout
+        engine = create_engine('sqlite://', poolclass=StaticPool)
+        with patch('pipeline.load.get_engine', return_value=engine):
+            load_data(sample_transformed_df)
+
+        conn = engine.raw_connection()
+        rows = conn.execute("""
+            SELECT f.order_id, c.customer_id, p.product_id, s.ship_mode
+            FROM fact_sales f
+            JOIN dim_customer c ON f.customer_key = c.customer_key
+            JOIN dim_product  p ON f.product_key  = p.product_key
+            JOIN dim_shipping s ON f.shipping_key = s.shipping_key
+            ORDER BY f.order_id
+        """).fetchall()
+        conn.close()
+        engine.dispose()
+
+        expected = sample_transformed_df.sort_values('order_id')[
+            ['order_id', 'customer_id', 'product_id', 'ship_mode']
+        ].astype(str)
+        assert rows == list(expected.itertuples(index=False, name=None))
+
+    def test_load_data_chunks_matches_single_batch(self, sample_raw_df, temp_warehouse):
+        from pipeline.transform import transform_data
+        from pipeline.load import load_data, load_data_chunks
+        # Second half repeats customers and products at later dates
+        later = sample_raw_df.assign(**{
+            'Order ID'   : ['CA-2020-001', 'CA-2020-002', 'CA-2020-003', 'CA-2020-004'],
+            'Order Date' : '2020-12-31',
+            'Ship Date'  : '2021-01-03'
+        })
+        df = transform_data(pd.concat([sample_raw_df, later], ignore_index=True))
+
+        load_data(df)
+        batch = read_tables(temp_warehouse)
+
+        counts = load_data_chunks([df.iloc[:2], df.iloc[2:3], df.iloc[3:]])
+        assert read_tables(temp_warehouse) == batch
+        assert counts['fact_sales'] == len(df)
+        assert counts['dim_customer'] == 3
+
+    def test_load_data_chunks_failure_keeps_previous_load(self, sample_transformed_df, temp_warehouse):
+        from pipeline.load import load_data, load_data_chunks
+        load_data(sample_transformed_df)
+        before = read_tables(temp_warehouse)
+
+        def failing_chunks():
+            yield sample_transformed_df.iloc[:2]
+            raise ValueError("bad chunk")
+
+        with pytest.raises(ValueError, match="bad chunk"):
+            load_data_chunks(failing_chunks())
+        assert read_tables(temp_warehouse) == before
+
+        conn = sqlite3.connect(temp_warehouse)
+        indexes = conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+        ).fetchone()[0]
+        conn.close()
+        assert indexes == 9
+
+
+# ============================================
+# TESTS: MAIN MODULE
+# ============================================
+
+class TestMain:
+    """Tests for pipeline/main.py"""
+
+    def test_run_stage_reraises_stage_error(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from pipeline.main import run_stage
+
+        def failing_items():
+            yield 1
+            yield 2
+            raise ValueError("stage failed")
+
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        received = []
+        with pytest.raises(ValueError, match="stage failed"):
+            for item in run_stage(executor, failing_items(), stop):
+                received.append(item)
+        assert received == [1, 2]
+
+        stop.set()
+        executor.shutdown(wait=True)
+        assert not any(thread.is_alive() for thread in executor._threads)
+
+    def test_run_stage_stop_unblocks_full_queue(self):
+        import itertools
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from pipeline.main import run_stage
+
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        # Endless producer: it blocks once the queue is full
+        results = run_stage(executor, itertools.count(), stop)
+        assert next(results) == 0
+
+        stop.set()
+        executor.shutdown(wait=True)
+        assert not any(thread.is_alive() for thread in executor._threads)
+
 
 # ============================================
 # TESTS: CONFIG MODULE